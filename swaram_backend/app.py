@@ -1,69 +1,106 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import base64
+from werkzeug.exceptions import RequestEntityTooLarge
+import logging
 import cv2
 import numpy as np
-from PIL import Image
-import io
 import random
+import threading
 import time
 
+try:
+    # SIMD-accelerated decoder; same API as the stdlib function
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+from config import Config
+
 app = Flask(__name__)
 CORS(app)
+# Responses are consumed by the app, not read by humans; skip key sorting
+app.json.sort_keys = False
+app.config['MAX_CONTENT_LENGTH'] = Config.MAX_FRAME_SIZE
+
+logger = logging.getLogger(__name__)
 
 # Malayalam words for mock responses
-MALAYALAM_WORDS = [
-    "നമസ്കാരം", "വണക്കം", "സ്നേഹം", "സഹായം", 
-    "നന്ദി", "കുശലം", "വീട്", "പാഠശാല",
-    "ആശുപത്രി", "ഭക്ഷണം", "ജലം", "സുഖം",
-    "കാറ്", "മരം", "പുസ്തകം", "ഫോൺ"
-]
+MALAYALAM_WORDS = Config.MALAYALAM_WORDS
+
+# Content types accepted as a raw (non-base64) image body on /api/lipread;
+# cv2.imdecode picks the codec from the data itself
+BINARY_IMAGE_TYPES = ('image/jpeg', 'image/png', 'image/webp', 'application/octet-stream')
+
+# Minimum seconds between fresh predictions for streamed video frames
+VIDEO_FRAME_INTERVAL = 2.0
 
 # Store last prediction to avoid too frequent updates
 last_prediction = ""
-last_prediction_time = 0
+last_prediction_time = float('-inf')
+# Guards the two globals above across request threads; the state is still
+# per process, so run a single worker (see wsgi.py)
+prediction_lock = threading.Lock()
 
 @app.route('/api/lipread', methods=['POST'])
 def lip_read():
     global last_prediction, last_prediction_time
     
     try:
-        data = request.json
+        if request.mimetype in BINARY_IMAGE_TYPES:
+            # Raw JPEG/PNG body: no base64 or JSON envelope to unwrap
+            image_data = request.get_data(cache=False)
+            is_video_frame = request.args.get('is_video_frame', 'false').lower() == 'true'
+        else:
+            data = request.json
+            
+            if not data or 'image' not in data:
+                return jsonify({
+                    'success': False,
+                    'error': 'No image data received'
+                }), 400
+            
+            image_base64 = data['image']
+            is_video_frame = data.get('is_video_frame', False)
+            
+            # Strip the data URI prefix, if any
+            _, _, image_base64 = image_base64.rpartition(',')
+            image_data = b64decode(image_base64, validate=False)
         
-        if not data or 'image' not in data:
+        if not image_data:
             return jsonify({
                 'success': False,
                 'error': 'No image data received'
             }), 400
         
-        image_base64 = data['image']
-        is_video_frame = data.get('is_video_frame', False)
-        
-        # Handle base64 data
-        if ',' in image_base64:
-            image_base64 = image_base64.split(',')[1]
-        
-        # Decode base64 image
-        image_data = base64.b64decode(image_base64)
-        image = Image.open(io.BytesIO(image_data))
-        image_np = np.array(image)
+        # Decode straight into an OpenCV image (no PIL round-trip); ignore EXIF
+        # orientation so image_size reports stored dimensions, as PIL did
+        image_np = cv2.imdecode(np.frombuffer(image_data, np.uint8),
+                                cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
         
-        current_time = time.time()
-        
-        # For video frames, only process every 2 seconds to avoid overload
-        if is_video_frame and (current_time - last_prediction_time < 2.0):
+        if image_np is None:
             return jsonify({
-                'success': True,
-                'text': last_prediction,
-                'language': 'malayalam',
-                'confidence': 0.8,
-                'is_cached': True
-            })
+                'success': False,
+                'error': 'Could not decode image data'
+            }), 400
         
-        # Mock AI prediction - replace with actual model later
-        predicted_text = random.choice(MALAYALAM_WORDS)
-        last_prediction = predicted_text
-        last_prediction_time = current_time
+        # Monotonic clock: elapsed-time math must not jump with NTP/wall-clock changes
+        current_time = time.monotonic()
+        
+        with prediction_lock:
+            # For video frames, only process every VIDEO_FRAME_INTERVAL seconds to avoid overload
+            if is_video_frame and (current_time - last_prediction_time < VIDEO_FRAME_INTERVAL):
+                return jsonify({
+                    'success': True,
+                    'text': last_prediction,
+                    'language': 'malayalam',
+                    'confidence': 0.8,
+                    'is_cached': True
+                })
+            
+            # Mock AI prediction - replace with actual model later
+            predicted_text = random.choice(MALAYALAM_WORDS)
+            last_prediction = predicted_text
+            last_prediction_time = current_time
         
         return jsonify({
             'success': True,
@@ -74,14 +111,23 @@ def lip_read():
             'image_size': f"{image_np.shape[1]}x{image_np.shape[0]}"
         })
         
+    except RequestEntityTooLarge as e:
+        return request_too_large(e)
     except Exception as e:
-        print(f"Error in lip_read: {str(e)}")
+        logger.error("Error in lip_read: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return jsonify({
             'success': False,
             'error': str(e),
             'text': 'പിശക് സംഭവിച്ചു'
         }), 500
 
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    return jsonify({
+        'success': False,
+        'error': f'Request body exceeds {Config.MAX_FRAME_SIZE} bytes'
+    }), 413
+
 @app.route('/api/test', methods=['GET'])
 def test():
     return jsonify({
@@ -91,8 +137,9 @@ def test():
     })
 
 if __name__ == '__main__':
-    print("🚀 Starting Swaram Backend with Real-time Video Support...")
-    print("📱 Endpoints:")
-    print("   GET  /api/test - Test endpoint")
-    print("   POST /api/lipread - Real-time lip reading")
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO)
+    logger.info("🚀 Starting Swaram Backend with Real-time Video Support...")
+    logger.info("📱 Endpoints:")
+    logger.info("   GET  /api/test - Test endpoint")
+    logger.info("   POST /api/lipread - Real-time lip reading")
+    app.run(host='0.0.0.0', port=5000, debug=Config.DEBUG)
\ No newline at end of file
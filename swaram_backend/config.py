@@ -0,0 +1,21 @@
+import os
+
+
+class Config:
+    # Flask debug mode (reloader + debugger); never enable in production
+    DEBUG = os.environ.get('SWARAM_DEBUG', '0') == '1'
+
+    # Largest accepted request body; oversized frames are rejected with a 413
+    # before they are read into memory
+    MAX_FRAME_SIZE = 4 * 1024 * 1024
+
+    # Malayalam words for mock lip-reading responses
+    MALAYALAM_WORDS = (
+        "നമസ്കാരം", "വണക്കം", "സ്നേഹം", "സഹായം",
+        "നന്ദി", "കുശലം", "വീട്", "പാഠശാല",
+        "ആശുപത്രി", "ഭക്ഷണം", "ജലം", "സുഖം",
+        "കാറ്", "മരം", "പുസ്തകം", "ഫോൺ"
+    )
+
+    # Malayalam character set predicted by the lip reading model
+    MALAYALAM_CHARS = "അആഇഈഉഊഋഌഎഏഐഒഓഔകഖഗഘങചഛജഝഞടഠഡഢണതഥദധനപഫബഭമയരലവശഷസഹളഴറഺംഃ"
@@ -0,0 +1,20 @@
+import logging
+import numpy as np
+import tensorflow as tf
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_inference(model):
+    """Trace the model's forward pass and warm it up; returns the inference fn"""
+    try:
+        # Only single-input models with a known shape get a fixed signature
+        spec = tf.TensorSpec(shape=model.input_shape, dtype=tf.float32)
+        infer = tf.function(lambda x: model(x, training=False), input_signature=[spec])
+
+        # One throwaway inference so the first real request is not slow
+        infer(np.zeros((1,) + tuple(model.input_shape[1:]), dtype=np.float32))
+        return infer
+    except Exception:
+        logger.warning("Model warm-up failed; calling the model directly", exc_info=True)
+        return lambda x: model(x, training=False)
@@ -1,25 +1,45 @@
+import logging
 import tensorflow as tf
 import numpy as np
 
+from config import Config
+from models.inference import prepare_inference
+
+# Malayalam character set, built once and shared by every model instance
+MALAYALAM_CHARS = tuple(Config.MALAYALAM_CHARS)
+CHAR_TO_IDX = {char: idx for idx, char in enumerate(MALAYALAM_CHARS)}
+IDX_TO_CHAR = dict(enumerate(MALAYALAM_CHARS))
+
+logger = logging.getLogger(__name__)
+
 class LipReadingModel:
     def __init__(self, model_path=None):
+        # Character set must exist before the placeholder model is sized
+        self.malayalam_chars = MALAYALAM_CHARS
+        self.char_to_idx = CHAR_TO_IDX
+        self.idx_to_char = IDX_TO_CHAR
+        
         # Load your pre-trained CNN-LSTM model
         # For now, using a placeholder
         self.model = None
         self.load_model(model_path)
-        
-        # Malayalam character set
-        self.malayalam_chars = "അആഇഈഉഊഋഌഎഏഐഒഓഔകഖഗഘങചഛജഝഞടഠഡഢണതഥദധനപഫബഭമയരലവശഷസഹളഴറഺംഃ"
-        self.char_to_idx = {char: idx for idx, char in enumerate(self.malayalam_chars)}
-        self.idx_to_char = {idx: char for idx, char in enumerate(self.malayalam_chars)}
     
     def load_model(self, model_path):
         if model_path:
             self.model = tf.keras.models.load_model(model_path)
+            # A loaded model must predict exactly one class per character
+            output_shape = getattr(self.model, 'output_shape', None)
+            num_classes = output_shape[-1] if isinstance(output_shape, tuple) else None
+            if num_classes is not None and num_classes != len(MALAYALAM_CHARS):
+                raise ValueError(
+                    f"Lip reading model has {num_classes} output classes, "
+                    f"expected {len(MALAYALAM_CHARS)}"
+                )
         else:
             # Create a simple placeholder model structure
             # Replace with your actual trained model
             self.model = self.create_placeholder_model()
+        self._infer = prepare_inference(self.model)
     
     def create_placeholder_model(self):
         """Create a placeholder model - replace with your trained model"""
@@ -37,8 +57,11 @@ class LipReadingModel:
     def predict(self, image):
         """Predict text from lip image"""
         if self.model:
-            prediction = self.model.predict(image)
-            predicted_idx = np.argmax(prediction[0])
-            return self.idx_to_char.get(predicted_idx, "അ")
+            prediction = self._infer(np.asarray(image, dtype=np.float32)).numpy()
+            predicted_idx = int(np.argmax(prediction[0]))
+            if predicted_idx >= len(MALAYALAM_CHARS):
+                logger.warning("Predicted index %d outside the character table", predicted_idx)
+                return MALAYALAM_CHARS[0]
+            return MALAYALAM_CHARS[predicted_idx]
         else:
             return "ലിപ് വായന മോഡൽ ലഭ്യമല്ല"  # "Lip reading model not available"
\ No newline at end of file
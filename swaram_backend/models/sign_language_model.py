@@ -1,23 +1,28 @@
+import threading
 import mediapipe as mp
 import tensorflow as tf
 import cv2
 import numpy as np
 
+from models.inference import prepare_inference
+
+# Frames whose longest side exceeds this are downscaled before any
+# preprocessing; landmarks are normalized to [0, 1], so the output is
+# resolution independent
+MAX_FRAME_DIMENSION = 480
+
 class SignLanguageModel:
     def __init__(self, model_path=None):
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=True,
-            max_num_hands=2,
-            min_detection_confidence=0.5
-        )
+        # MediaPipe graphs are not thread-safe; each worker thread gets its own
+        self._local = threading.local()
+        
+        # Malayalam sign language labels; needed to size the placeholder model
+        self.sign_labels = ["നമസ്കാരം", "നന്ദി", "സഹായം", "ആശുപത്രി", "വീട്"]
         
         # Load your sign language recognition model
         self.model = None
         self.load_model(model_path)
-        
-        # Malayalam sign language labels
-        self.sign_labels = ["നമസ്കാരം", "നന്ദി", "സഹായം", "ആശുപത്രി", "വീട്"]
     
     def load_model(self, model_path):
         if model_path:
@@ -25,6 +30,7 @@ class SignLanguageModel:
         else:
             # Placeholder model
             self.model = self.create_placeholder_model()
+        self._infer = prepare_inference(self.model)
     
     def create_placeholder_model(self):
         """Create a placeholder model - replace with your trained model"""
@@ -35,31 +41,57 @@ class SignLanguageModel:
         ])
         return model
     
+    @property
+    def hands(self):
+        """MediaPipe Hands instance for the calling thread"""
+        hands = getattr(self._local, 'hands', None)
+        if hands is None:
+            hands = self.mp_hands.Hands(
+                static_image_mode=True,
+                max_num_hands=2,
+                min_detection_confidence=0.5
+            )
+            self._local.hands = hands
+        return hands
+    
     def extract_hand_landmarks(self, image):
         """Extract hand landmarks using MediaPipe"""
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        height, width = image.shape[:2]
+        scale = MAX_FRAME_DIMENSION / max(height, width)
+        if scale < 1.0:
+            new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            image = cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+        
+        if image.ndim == 3 and image.shape[2] == 3 and image.dtype == np.uint8:
+            # Convert into a per-thread buffer reused across frames of the same size
+            buffer = getattr(self._local, 'rgb_buffer', None)
+            if buffer is None or buffer.shape != image.shape:
+                buffer = np.empty(image.shape, dtype=np.uint8)
+                self._local.rgb_buffer = buffer
+            buffer.flags.writeable = True
+            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=buffer)
+        else:
+            # e.g. BGRA input: let OpenCV allocate the 3-channel output
+            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        # Read-only, contiguous input lets MediaPipe use the buffer without copying
+        rgb_image.flags.writeable = False
         results = self.hands.process(rgb_image)
         
-        landmarks = []
+        # Fixed-size (x, y) vector for the first detected hand, zero-padded
+        landmarks = np.zeros(42, dtype=np.float32)
         if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                for landmark in hand_landmarks.landmark:
-                    landmarks.extend([landmark.x, landmark.y])
-        
-        # Pad or truncate to fixed size
-        if len(landmarks) < 42:
-            landmarks.extend([0] * (42 - len(landmarks)))
-        else:
-            landmarks = landmarks[:42]
-            
-        return np.array(landmarks)
+            hand = results.multi_hand_landmarks[0].landmark
+            coords = np.array([(lm.x, lm.y) for lm in hand], dtype=np.float32)
+            landmarks[:coords.size] = coords.ravel()[:42]
+
+        return landmarks
     
     def predict(self, image):
         """Predict sign language from image"""
         landmarks = self.extract_hand_landmarks(image)
         
         if self.model and len(landmarks) == 42:
-            prediction = self.model.predict(landmarks.reshape(1, -1))
+            prediction = self._infer(landmarks.reshape(1, -1)).numpy()
             predicted_idx = np.argmax(prediction[0])
             return self.sign_labels[predicted_idx]
         else:
@@ -0,0 +1,7 @@
+# Production entry point, e.g.:
+#   gunicorn -w 1 -k gthread --threads 4 -b 0.0.0.0:5000 wsgi:application
+# Keep a single worker: the video-frame throttle state in app.py lives in
+# process memory, so several workers would each throttle independently.
+from app import app
+
+application = app